@@ -0,0 +1,70 @@
+"""
+Batch combat kernels for the structure-of-arrays character pool.
+
+The kernels are written in the restricted loop-and-scalar style that
+numba.njit compiles directly: integer indexing only, no Python objects
+and no allocation inside the loop. When numba is installed the kernels
+are JIT-compiled with on-disk caching so the compile cost is paid once;
+without it they run as plain Python over anything supporting integer
+indexing (array('i') columns and NumPy arrays alike). numba itself
+requires NumPy-array inputs, which the pool columns provide zero-copy
+through the buffer protocol.
+"""
+
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """
+        No-op stand-in for numba.njit when numba is not installed.
+        """
+        def decorate(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return decorate
+
+
+@njit(cache=True)
+def resolve_attacks(xs, ys, hp, prot, atk_ids, tgt_ids, dmg) -> None:
+    """
+    Applies a batch of melee attacks in one pass over the state columns.
+
+    Each attack k is gated on 4-adjacency (Manhattan distance 1,
+    matching Character.can_attack) and its damage hits protection
+    before health, clamping both at zero.
+
+    Args:
+        xs: x-coordinate column.
+        ys: y-coordinate column.
+        hp: hit-point column, written in place.
+        prot: protection column, written in place.
+        atk_ids: row indices of the attackers.
+        tgt_ids: row indices of the targets.
+        dmg: damage amount per attack.
+    """
+    for k in range(len(atk_ids)):
+        a = atk_ids[k]
+        t = tgt_ids[k]
+        if abs(xs[a] - xs[t]) + abs(ys[a] - ys[t]) != 1:
+            continue
+        d = dmg[k]
+        shield = prot[t]
+        if shield > 0:
+            prot[t] = shield - d if shield > d else 0
+            d = d - shield if d > shield else 0
+        if d > 0:
+            remaining = hp[t] - d
+            hp[t] = remaining if remaining > 0 else 0
+
+
+if _HAVE_NUMBA:
+    # Trigger (or load the cached) compilation at import time so the
+    # first real tick does not pay the JIT cost.
+    import numpy as _np
+
+    _empty = _np.zeros(0, dtype=_np.int32)
+    resolve_attacks(_empty, _empty, _empty, _empty, _empty, _empty, _empty)